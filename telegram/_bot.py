@@ -24,6 +24,7 @@ import copy
 import functools
 import pickle
 from datetime import datetime
+from pathlib import Path
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -407,6 +408,36 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
             local_mode=self._local_mode,
         )
 
+    async def _parse_file_input_async(
+        self,
+        file_input: Union[FileInput, "TelegramObject"],
+        tg_type: Optional[Type["TelegramObject"]] = None,
+        filename: Optional[str] = None,
+        attach: bool = False,
+    ) -> Union[str, "InputFile", Any]:
+        """Variant of :meth:`_parse_file_input` for use in the bot methods. Parsing file input
+        may need to access the file system - checking whether a string points to a local file
+        and reading that file - which would block the event loop while the request is being
+        built. Run the parsing in the thread pool executor instead.
+        """
+        # bytes, InputFile and existing Telegram media objects are parsed purely in memory -
+        # for those the executor round-trip would only add scheduling overhead. Only strings
+        # and paths (may point to a local file) and file objects (must be read) can block.
+        if not isinstance(file_input, (str, Path)) and not hasattr(file_input, "read"):
+            return self._parse_file_input(
+                file_input=file_input, tg_type=tg_type, filename=filename, attach=attach
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self._parse_file_input,
+                file_input=file_input,
+                tg_type=tg_type,
+                filename=filename,
+                attach=attach,
+            ),
+        )
+
     def _insert_defaults(self, data: Dict[str, object]) -> None:  # skipcq: PYL-R0201
         """This method is here to make ext.Defaults work. Because we need to be able to tell
         e.g. `send_message(chat_id, text)` from `send_message(chat_id, text, parse_mode=None)`, the
@@ -430,17 +461,22 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         for key, val in data.items():
             # 1)
             if isinstance(val, InputMedia):
-                # Copy object as not to edit it in-place
-                new = copy.copy(val)
-                with new._unfrozen():
-                    new.parse_mode = DefaultValue.get_value(new.parse_mode)
-                data[key] = new
+                if isinstance(val.parse_mode, DefaultValue):
+                    # Copy object as not to edit it in-place
+                    new = copy.copy(val)
+                    with new._unfrozen():
+                        new.parse_mode = DefaultValue.get_value(new.parse_mode)
+                    data[key] = new
             elif key == "media" and isinstance(val, Sequence):
-                # Copy objects as not to edit them in-place
-                copy_list = [copy.copy(media) for media in val]
-                for media in copy_list:
-                    with media._unfrozen():
-                        media.parse_mode = DefaultValue.get_value(media.parse_mode)
+                # Copy objects as not to edit them in-place - doing so is only necessary for
+                # the entries that still carry a DefaultValue sentinel
+                copy_list = []
+                for media in val:
+                    if isinstance(media.parse_mode, DefaultValue):
+                        media = copy.copy(media)
+                        with media._unfrozen():
+                            media.parse_mode = DefaultValue.get_value(media.parse_mode)
+                    copy_list.append(media)
 
                 data[key] = copy_list
             # 2)
@@ -1042,7 +1078,7 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         """
         data: JSONDict = {
             "chat_id": chat_id,
-            "photo": self._parse_file_input(photo, PhotoSize, filename=filename),
+            "photo": await self._parse_file_input_async(photo, PhotoSize, filename=filename),
             "has_spoiler": has_spoiler,
         }
 
@@ -1182,11 +1218,11 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         )
         data: JSONDict = {
             "chat_id": chat_id,
-            "audio": self._parse_file_input(audio, Audio, filename=filename),
+            "audio": await self._parse_file_input_async(audio, Audio, filename=filename),
             "duration": duration,
             "performer": performer,
             "title": title,
-            "thumbnail": self._parse_file_input(thumbnail_or_thumb, attach=True)
+            "thumbnail": await self._parse_file_input_async(thumbnail_or_thumb, attach=True)
             if thumbnail_or_thumb
             else None,
         }
@@ -1323,9 +1359,9 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
 
         data: JSONDict = {
             "chat_id": chat_id,
-            "document": self._parse_file_input(document, Document, filename=filename),
+            "document": await self._parse_file_input_async(document, Document, filename=filename),
             "disable_content_type_detection": disable_content_type_detection,
-            "thumbnail": self._parse_file_input(thumbnail_or_thumb, attach=True)
+            "thumbnail": await self._parse_file_input_async(thumbnail_or_thumb, attach=True)
             if thumbnail_or_thumb
             else None,
         }
@@ -1416,7 +1452,7 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         """
         data: JSONDict = {
             "chat_id": chat_id,
-            "sticker": self._parse_file_input(sticker, Sticker),
+            "sticker": await self._parse_file_input_async(sticker, Sticker),
             "emoji": emoji,
         }
         return await self._send_message(
@@ -1562,12 +1598,12 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         )
         data: JSONDict = {
             "chat_id": chat_id,
-            "video": self._parse_file_input(video, Video, filename=filename),
+            "video": await self._parse_file_input_async(video, Video, filename=filename),
             "duration": duration,
             "width": width,
             "height": height,
             "supports_streaming": supports_streaming,
-            "thumbnail": self._parse_file_input(thumbnail_or_thumb, attach=True)
+            "thumbnail": await self._parse_file_input_async(thumbnail_or_thumb, attach=True)
             if thumbnail_or_thumb
             else None,
             "has_spoiler": has_spoiler,
@@ -1698,10 +1734,12 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         )
         data: JSONDict = {
             "chat_id": chat_id,
-            "video_note": self._parse_file_input(video_note, VideoNote, filename=filename),
+            "video_note": await self._parse_file_input_async(
+                video_note, VideoNote, filename=filename
+            ),
             "duration": duration,
             "length": length,
-            "thumbnail": self._parse_file_input(thumbnail_or_thumb, attach=True)
+            "thumbnail": await self._parse_file_input_async(thumbnail_or_thumb, attach=True)
             if thumbnail_or_thumb
             else None,
         }
@@ -1842,11 +1880,13 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         )
         data: JSONDict = {
             "chat_id": chat_id,
-            "animation": self._parse_file_input(animation, Animation, filename=filename),
+            "animation": await self._parse_file_input_async(
+                animation, Animation, filename=filename
+            ),
             "duration": duration,
             "width": width,
             "height": height,
-            "thumbnail": self._parse_file_input(thumbnail_or_thumb, attach=True)
+            "thumbnail": await self._parse_file_input_async(thumbnail_or_thumb, attach=True)
             if thumbnail_or_thumb
             else None,
             "has_spoiler": has_spoiler,
@@ -1964,7 +2004,7 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         """
         data: JSONDict = {
             "chat_id": chat_id,
-            "voice": self._parse_file_input(voice, Voice, filename=filename),
+            "voice": await self._parse_file_input_async(voice, Voice, filename=filename),
             "duration": duration,
         }
 
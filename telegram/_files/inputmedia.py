@@ -17,7 +17,8 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """Base class for Telegram InputMedia Objects."""
-from typing import Optional, Sequence, Tuple, Union
+from operator import methodcaller
+from typing import Optional, Sequence, Tuple, Type, Union
 
 from telegram._files.animation import Animation
 from telegram._files.audio import Audio
@@ -39,6 +40,9 @@ from telegram.constants import InputMediaType
 
 MediaType = Union[Animation, Audio, Document, PhotoSize, Video]
 
+# Prebuilt to skip the per-element attribute lookup when serializing caption entities
+_ENTITY_TO_DICT = methodcaller("to_dict")
+
 
 class InputMedia(TelegramObject):
     """
@@ -85,7 +89,7 @@ class InputMedia(TelegramObject):
 
     """
 
-    __slots__ = ("caption", "caption_entities", "media", "parse_mode", "type")
+    __slots__ = ("_cached_to_dict", "caption", "caption_entities", "media", "parse_mode", "type")
 
     def __init__(
         self,
@@ -103,15 +107,83 @@ class InputMedia(TelegramObject):
         self.caption: Optional[str] = caption
         self.caption_entities: Tuple[MessageEntity, ...] = parse_sequence_arg(caption_entities)
         self.parse_mode: ODVInput[str] = parse_mode
+        self._cached_to_dict: Optional[JSONDict] = None
 
         self._freeze()
 
+    def _unfreeze(self) -> None:
+        # All mutation paths (the _unfrozen context manager, unpickling) unfreeze the object
+        # first, so dropping the cached dict representation here keeps it consistent without
+        # any bookkeeping on the hot construction and serialization paths
+        self._cached_to_dict = None
+        super()._unfreeze()
+
+    def to_dict(self, recursive: bool = True) -> JSONDict:
+        """See :meth:`telegram.TelegramObject.to_dict`."""
+        if not recursive:
+            return super().to_dict(recursive=recursive)
+
+        # Objects of this type are immutable after construction, so the dict representation
+        # can be computed once and reused, e.g. within a retried sendMediaGroup request.
+        # A shallow copy is returned so that callers may modify top level entries, as e.g.
+        # RequestParameter does for the media and thumbnail keys.
+        cached = self._cached_to_dict
+        if cached is None:
+            # Specialization of TelegramObject.to_dict for the media group hot path:
+            # caption_entities is the only sequence attribute of InputMedia objects and there
+            # are no datetime attributes, so the generic per-attribute conversion loop can be
+            # skipped.
+            out = self._get_attrs(recursive=True)
+
+            # caption_entities is always a tuple (never None), so a single truthiness check
+            # both detects the empty case and saves a second attribute load
+            caption_entities = self.caption_entities
+            if caption_entities:
+                # Cached as tuple so that the shallow copies handed out below never share a
+                # mutable list; converted back to a list on the way out
+                out["caption_entities"] = tuple(map(_ENTITY_TO_DICT, caption_entities))
+            else:
+                out.pop("caption_entities", None)
+
+            # Effectively "unpack" api_kwargs into `out`:
+            out.update(out.pop("api_kwargs", {}))  # type: ignore[call-overload]
+            cached = self._cached_to_dict = out
+
+        out = dict(cached)
+        entities = out.get("caption_entities")
+        if entities is not None:
+            # The entity dicts are copied as well - they are small and flat, so the cache still
+            # pays off and callers may mutate the output without corrupting later calls
+            out["caption_entities"] = [dict(entity) for entity in entities]
+        return out
+
     @staticmethod
-    def _parse_thumb_input(thumb: Optional[FileInput]) -> Optional[Union[str, InputFile]]:
+    def _parse_thumb_input(
+        thumb: Optional[FileInput], thumbnail: Optional[FileInput]
+    ) -> Optional[Union[str, InputFile]]:
+        # stacklevel=3 accounts for this helper frame so that the deprecation warning still
+        # points at the caller of the subclass constructor
+        thumbnail = warn_about_thumb_return_thumbnail(
+            deprecated_arg=thumb, new_arg=thumbnail, stacklevel=3
+        )
         # We use local_mode=True because we don't have access to the actual setting and want
         # things to work in local mode.
         return (
-            parse_file_input(thumb, attach=True, local_mode=True) if thumb is not None else thumb
+            parse_file_input(thumbnail, attach=True, local_mode=True)
+            if thumbnail is not None
+            else thumbnail
+        )
+
+    @staticmethod
+    def _parse_media_input(
+        media: Union[FileInput, MediaType],
+        filename: Optional[str] = None,
+        tg_type: Optional[Type[TelegramObject]] = None,
+    ) -> Union[str, InputFile]:
+        # We use local_mode=True because we don't have access to the actual setting and want
+        # things to work in local mode.
+        return parse_file_input(
+            media, tg_type=tg_type, filename=filename, attach=True, local_mode=True
         )
 
 
@@ -191,7 +263,7 @@ class InputMediaAnimation(InputMedia):
             .. versionadded:: 20.2
     """
 
-    __slots__ = ("duration", "height", "width", "has_spoiler", "thumbnail")
+    __slots__ = ("duration", "has_spoiler", "height", "thumbnail", "width")
 
     def __init__(
         self,
@@ -209,17 +281,16 @@ class InputMediaAnimation(InputMedia):
         *,
         api_kwargs: Optional[JSONDict] = None,
     ):
-        if isinstance(media, Animation):
+        # Only existing Telegram media objects carry a file_id, so the getattr short-circuits
+        # the isinstance check for the much more common str / file input
+        if getattr(media, "file_id", None) is not None and isinstance(media, Animation):
             width = media.width if width is None else width
             height = media.height if height is None else height
             duration = media.duration if duration is None else duration
             media = media.file_id
         else:
-            # We use local_mode=True because we don't have access to the actual setting and want
-            # things to work in local mode.
-            media = parse_file_input(media, filename=filename, attach=True, local_mode=True)
+            media = self._parse_media_input(media, filename=filename)
 
-        thumbnail = warn_about_thumb_return_thumbnail(deprecated_arg=thumb, new_arg=thumbnail)
         super().__init__(
             InputMediaType.ANIMATION,
             media,
@@ -229,7 +300,9 @@ class InputMediaAnimation(InputMedia):
             api_kwargs=api_kwargs,
         )
         with self._unfrozen():
-            self.thumbnail: Optional[Union[str, InputFile]] = self._parse_thumb_input(thumbnail)
+            self.thumbnail: Optional[Union[str, InputFile]] = self._parse_thumb_input(
+                thumb, thumbnail
+            )
             self.width: Optional[int] = width
             self.height: Optional[int] = height
             self.duration: Optional[int] = duration
@@ -312,9 +385,7 @@ class InputMediaPhoto(InputMedia):
         *,
         api_kwargs: Optional[JSONDict] = None,
     ):
-        # We use local_mode=True because we don't have access to the actual setting and want
-        # things to work in local mode.
-        media = parse_file_input(media, PhotoSize, filename=filename, attach=True, local_mode=True)
+        media = self._parse_media_input(media, filename=filename, tg_type=PhotoSize)
         super().__init__(
             InputMediaType.PHOTO,
             media,
@@ -413,11 +484,11 @@ class InputMediaVideo(InputMedia):
 
     __slots__ = (
         "duration",
+        "has_spoiler",
         "height",
         "supports_streaming",
-        "width",
-        "has_spoiler",
         "thumbnail",
+        "width",
     )
 
     def __init__(
@@ -437,17 +508,16 @@ class InputMediaVideo(InputMedia):
         *,
         api_kwargs: Optional[JSONDict] = None,
     ):
-        if isinstance(media, Video):
-            width = width if width is not None else media.width
-            height = height if height is not None else media.height
-            duration = duration if duration is not None else media.duration
+        # Only existing Telegram media objects carry a file_id, so the getattr short-circuits
+        # the isinstance check for the much more common str / file input
+        if getattr(media, "file_id", None) is not None and isinstance(media, Video):
+            width = media.width if width is None else width
+            height = media.height if height is None else height
+            duration = media.duration if duration is None else duration
             media = media.file_id
         else:
-            # We use local_mode=True because we don't have access to the actual setting and want
-            # things to work in local mode.
-            media = parse_file_input(media, filename=filename, attach=True, local_mode=True)
+            media = self._parse_media_input(media, filename=filename)
 
-        thumbnail = warn_about_thumb_return_thumbnail(deprecated_arg=thumb, new_arg=thumbnail)
         super().__init__(
             InputMediaType.VIDEO,
             media,
@@ -460,7 +530,9 @@ class InputMediaVideo(InputMedia):
             self.width: Optional[int] = width
             self.height: Optional[int] = height
             self.duration: Optional[int] = duration
-            self.thumbnail: Optional[Union[str, InputFile]] = self._parse_thumb_input(thumbnail)
+            self.thumbnail: Optional[Union[str, InputFile]] = self._parse_thumb_input(
+                thumb, thumbnail
+            )
             self.supports_streaming: Optional[bool] = supports_streaming
             self.has_spoiler: Optional[bool] = has_spoiler
 
@@ -550,7 +622,7 @@ class InputMediaAudio(InputMedia):
 
     """
 
-    __slots__ = ("duration", "performer", "title", "thumbnail")
+    __slots__ = ("duration", "performer", "thumbnail", "title")
 
     def __init__(
         self,
@@ -567,17 +639,16 @@ class InputMediaAudio(InputMedia):
         *,
         api_kwargs: Optional[JSONDict] = None,
     ):
-        if isinstance(media, Audio):
+        # Only existing Telegram media objects carry a file_id, so the getattr short-circuits
+        # the isinstance check for the much more common str / file input
+        if getattr(media, "file_id", None) is not None and isinstance(media, Audio):
             duration = media.duration if duration is None else duration
             performer = media.performer if performer is None else performer
             title = media.title if title is None else title
             media = media.file_id
         else:
-            # We use local_mode=True because we don't have access to the actual setting and want
-            # things to work in local mode.
-            media = parse_file_input(media, filename=filename, attach=True, local_mode=True)
+            media = self._parse_media_input(media, filename=filename)
 
-        thumbnail = warn_about_thumb_return_thumbnail(deprecated_arg=thumb, new_arg=thumbnail)
         super().__init__(
             InputMediaType.AUDIO,
             media,
@@ -587,7 +658,9 @@ class InputMediaAudio(InputMedia):
             api_kwargs=api_kwargs,
         )
         with self._unfrozen():
-            self.thumbnail: Optional[Union[str, InputFile]] = self._parse_thumb_input(thumbnail)
+            self.thumbnail: Optional[Union[str, InputFile]] = self._parse_thumb_input(
+                thumb, thumbnail
+            )
             self.duration: Optional[int] = duration
             self.title: Optional[str] = title
             self.performer: Optional[str] = performer
@@ -685,11 +758,8 @@ class InputMediaDocument(InputMedia):
         *,
         api_kwargs: Optional[JSONDict] = None,
     ):
-        # We use local_mode=True because we don't have access to the actual setting and want
-        # things to work in local mode.
-        media = parse_file_input(media, Document, filename=filename, attach=True, local_mode=True)
+        media = self._parse_media_input(media, filename=filename, tg_type=Document)
 
-        thumbnail = warn_about_thumb_return_thumbnail(deprecated_arg=thumb, new_arg=thumbnail)
         super().__init__(
             InputMediaType.DOCUMENT,
             media,
@@ -699,7 +769,9 @@ class InputMediaDocument(InputMedia):
             api_kwargs=api_kwargs,
         )
         with self._unfrozen():
-            self.thumbnail: Optional[Union[str, InputFile]] = self._parse_thumb_input(thumbnail)
+            self.thumbnail: Optional[Union[str, InputFile]] = self._parse_thumb_input(
+                thumb, thumbnail
+            )
             self.disable_content_type_detection: Optional[bool] = disable_content_type_detection
 
     @property
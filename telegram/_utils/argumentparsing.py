@@ -37,4 +37,7 @@ def parse_sequence_arg(arg: Optional[Sequence[T]]) -> Tuple[T, ...]:
     Returns:
         :obj:`Tuple`: The sequence converted to a tuple or an empty tuple.
     """
-    return tuple(arg) if arg else ()
+    if not arg:
+        return ()
+    # Tuples are immutable, so there is no need to pay for a copy
+    return arg if isinstance(arg, tuple) else tuple(arg)
@@ -38,6 +38,19 @@ if TYPE_CHECKING:
 
 _T = TypeVar("_T", bound=Union[bytes, "InputFile", str, Path, None])
 
+_INPUT_FILE_CLS: Optional[Type["InputFile"]] = None
+
+
+def _get_input_file_cls() -> Type["InputFile"]:
+    """Cached accessor for :class:`telegram.InputFile` - importing it on file-level yields
+    cyclic import errors."""
+    global _INPUT_FILE_CLS  # pylint: disable=global-statement
+    if _INPUT_FILE_CLS is None:
+        from telegram import InputFile  # pylint: disable=import-outside-toplevel
+
+        _INPUT_FILE_CLS = InputFile
+    return _INPUT_FILE_CLS
+
 
 @overload
 def load_file(obj: IO[bytes]) -> Tuple[Optional[str], bytes]:
@@ -128,19 +141,27 @@ def parse_file_input(  # pylint: disable=too-many-return-statements
         :obj:`str` | :class:`telegram.InputFile` | :obj:`object`: The parsed input or the untouched
         :attr:`file_input`, in case it's no valid file input.
     """
-    # Importing on file-level yields cyclic Import Errors
-    from telegram import InputFile  # pylint: disable=import-outside-toplevel
+    InputFile = _get_input_file_cls()
 
     if isinstance(file_input, str) and file_input.startswith("file://"):
         if not local_mode:
             raise ValueError("Specified file input is a file URI, but local mode is not enabled.")
         return file_input
     if isinstance(file_input, (str, Path)):
-        if is_local_file(file_input):
-            path = Path(file_input)
+        # Same check as is_local_file, but builds the Path only once instead of constructing
+        # a second one for the local file branch below
+        path = Path(file_input)
+        try:
+            local_file = path.is_file()
+        except Exception:
+            local_file = False
+        if local_file:
             if local_mode:
                 return path.absolute().as_uri()
-            return InputFile(path.open(mode="rb"), filename=filename, attach=attach)
+            # Close the file handle right after reading - otherwise it would stay open
+            # until garbage collection while the request is in flight
+            with path.open(mode="rb") as file_handle:
+                return InputFile(file_handle, filename=filename, attach=attach)
 
         return file_input
     if isinstance(file_input, bytes):
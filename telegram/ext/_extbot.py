@@ -410,12 +410,15 @@ class ExtBot(Bot, Generic[RLARGS]):
                     copied_val.parse_mode = self.defaults.parse_mode if self.defaults else None
                 data[key] = copied_val
             elif key == "media" and isinstance(val, Sequence):
-                # Copy objects as not to edit them in-place
-                copy_list = [copy(media) for media in val]
-                for media in copy_list:
+                # Copy objects as not to edit them in-place - doing so is only necessary for
+                # the entries that still carry the DEFAULT_NONE sentinel
+                copy_list = []
+                for media in val:
                     if media.parse_mode is DEFAULT_NONE:
+                        media = copy(media)
                         with media._unfrozen():
                             media.parse_mode = self.defaults.parse_mode if self.defaults else None
+                    copy_list.append(media)
 
                 data[key] = copy_list
 
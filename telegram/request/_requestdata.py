@@ -109,7 +109,9 @@ class RequestData:
             To use a custom library for JSON encoding, you can directly encode the keys of
             :attr:`parameters` - note that string valued keys should not be JSON encoded.
         """
-        return json.dumps(self.json_parameters).encode("utf-8")
+        # Compact separators save a few bytes per entry on the wire compared to the default
+        # ", "/": " without changing the content
+        return json.dumps(self.json_parameters, separators=(",", ":")).encode("utf-8")
 
     @property
     def multipart_data(self) -> UploadFileDict:
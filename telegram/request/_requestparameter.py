@@ -73,7 +73,9 @@ class RequestParameter:
             return self.value
         if self.value is None:
             return None
-        return json.dumps(self.value)
+        # Compact separators save a few bytes per entry on the wire compared to the default
+        # ", "/": " without changing the content
+        return json.dumps(self.value, separators=(",", ":"))
 
     @property
     def multipart_data(self) -> Optional[UploadFileDict]:
@@ -108,6 +110,11 @@ class RequestParameter:
         * if a user passes a custom enum, it's unlikely that we can actually properly handle it
           even with some special casing.
         """
+        if value is None or type(value) in (str, int, float, bool):
+            # Shortcut for the most common case: plain scalars make up the bulk of the
+            # parameters of a request. The exact type check is required so that e.g. StringEnum
+            # members, which are subclasses of str, still take the conversion paths below.
+            return value, []
         if isinstance(value, datetime):
             return to_timestamp(value), []
         if isinstance(value, StringEnum):
@@ -18,6 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 import asyncio
 import copy
+import pickle
 from collections.abc import Sequence
 from typing import Optional
 
@@ -259,6 +260,50 @@ class TestInputMediaPhotoWithoutRequest(TestInputMediaPhotoBase):
         ]
         assert input_media_photo_dict["has_spoiler"] == input_media_photo.has_spoiler
 
+    def test_to_dict_cached_outputs_are_independent(self):
+        # to_dict caches the dict representation. Mutating one output must not leak into
+        # later calls, neither on the top level nor in the nested entity dicts
+        input_media_photo = InputMediaPhoto(
+            self.media,
+            caption=self.caption,
+            parse_mode=self.parse_mode,
+            caption_entities=self.caption_entities,
+        )
+        first = input_media_photo.to_dict()
+        second = input_media_photo.to_dict()
+        assert first == second
+        assert first is not second
+
+        first["media"] = "other media"
+        first["caption_entities"][0]["type"] = MessageEntity.ITALIC
+        first["caption_entities"].append("extra")
+        third = input_media_photo.to_dict()
+        assert third["media"] == self.media
+        assert third["caption_entities"] == [ce.to_dict() for ce in self.caption_entities]
+
+    def test_to_dict_cache_invalidated_on_mutation(self):
+        input_media_photo = InputMediaPhoto(self.media, caption=self.caption)
+        assert input_media_photo.to_dict()["caption"] == self.caption
+
+        with input_media_photo._unfrozen():
+            input_media_photo.caption = "new caption"
+        assert input_media_photo.to_dict()["caption"] == "new caption"
+
+    def test_to_dict_cache_survives_copy_and_pickle(self):
+        original = InputMediaPhoto(
+            self.media,
+            caption=self.caption,
+            parse_mode=self.parse_mode,
+            caption_entities=self.caption_entities,
+        )
+        expected = original.to_dict()  # also populates the cache
+        for duplicate in (
+            copy.copy(original),
+            copy.deepcopy(original),
+            pickle.loads(pickle.dumps(original)),
+        ):
+            assert duplicate.to_dict() == expected
+
     def test_with_photo(self, photo):  # noqa: F811
         # fixture found in test_photo
         input_media_photo = InputMediaPhoto(photo, caption="test 2")
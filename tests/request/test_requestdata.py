@@ -66,8 +66,10 @@ def simple_jsons() -> Dict[str, Any]:
     return {
         "string": "string",
         "integer": json.dumps(1),
-        "tg_object": MessageEntity("type", 1, 1).to_json(),
-        "list": json.dumps([1, "string", MessageEntity("type", 1, 1).to_dict()]),
+        "tg_object": json.dumps(MessageEntity("type", 1, 1).to_dict(), separators=(",", ":")),
+        "list": json.dumps(
+            [1, "string", MessageEntity("type", 1, 1).to_dict()], separators=(",", ":")
+        ),
     }
 
 
@@ -97,8 +99,10 @@ def file_jsons(inputfiles, input_media_video, input_media_photo) -> Dict[str, An
     input_media_photo_dict["media"] = input_media_photo.media.attach_uri
     return {
         "inputfile_attach": inputfiles[True].attach_uri,
-        "inputmedia": json.dumps(input_media_video_dict),
-        "inputmedia_list": json.dumps([input_media_video_dict, input_media_photo_dict]),
+        "inputmedia": json.dumps(input_media_video_dict, separators=(",", ":")),
+        "inputmedia_list": json.dumps(
+            [input_media_video_dict, input_media_photo_dict], separators=(",", ":")
+        ),
     }
 
 
@@ -178,9 +182,9 @@ class TestRequestDataWithoutRequest:
     def test_json_payload(
         self, simple_rqs, file_rqs, mixed_rqs, simple_jsons, file_jsons, mixed_jsons
     ):
-        assert simple_rqs.json_payload == json.dumps(simple_jsons).encode()
-        assert file_rqs.json_payload == json.dumps(file_jsons).encode()
-        assert mixed_rqs.json_payload == json.dumps(mixed_jsons).encode()
+        assert simple_rqs.json_payload == json.dumps(simple_jsons, separators=(",", ":")).encode()
+        assert file_rqs.json_payload == json.dumps(file_jsons, separators=(",", ":")).encode()
+        assert mixed_rqs.json_payload == json.dumps(mixed_jsons, separators=(",", ":")).encode()
 
     def test_multipart_data(
         self,
@@ -20,6 +20,7 @@ import asyncio
 import copy
 import datetime as dtm
 import inspect
+import json
 import logging
 import pickle
 import re
@@ -1147,7 +1148,7 @@ class TestBotWithoutRequest:
         async def make_assertion(url, request_data: RequestData, *args, **kwargs):
             data = request_data.json_parameters
             chat_id = data["chat_id"] == "2"
-            permissions = data["permissions"] == chat_permissions.to_json()
+            permissions = json.loads(data["permissions"]) == chat_permissions.to_dict()
             use_independent_chat_permissions = data["use_independent_chat_permissions"]
             return chat_id and permissions and use_independent_chat_permissions
 
@@ -1297,7 +1298,7 @@ class TestBotWithoutRequest:
             data = request_data.json_parameters
             chat_id = data["chat_id"] == "@chat"
             user_id = data["user_id"] == "2"
-            permissions = data["permissions"] == chat_permissions.to_json()
+            permissions = json.loads(data["permissions"]) == chat_permissions.to_dict()
             until_date = data["until_date"] == "200"
             use_independent_chat_permissions = data["use_independent_chat_permissions"]
             return (